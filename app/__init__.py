@@ -0,0 +1 @@
+"""FastAPI backend application for the Predator12 service."""
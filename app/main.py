@@ -0,0 +1,59 @@
+"""FastAPI entry point for the Predator12 backend service.
+
+For production deployments run the app with the C event loop and HTTP
+parser, scaling workers to the host::
+
+    uvicorn app.main:app --loop uvloop --http httptools --workers $(nproc)
+
+(``WEB_CONCURRENCY`` is honoured by uvicorn as an alternative to
+``--workers``.) The module also installs uvloop itself when available so
+that embedded/tooling invocations get the fast loop by default.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import orjson
+import fastapi.dependencies.utils as _dependency_utils
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
+
+# FastAPI versions without the upstream inspect-signature cache
+# (fastapi#13974) re-run inspect.signature during dependency solving;
+# wrap the hook once here. Skipped when upstream already caches it.
+if not hasattr(_dependency_utils.get_typed_signature, "cache_clear"):
+    _dependency_utils.get_typed_signature = lru_cache(maxsize=4096)(
+        _dependency_utils.get_typed_signature
+    )
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional accelerator
+    uvloop = None
+else:
+    uvloop.install()
+
+app = FastAPI(
+    title="Predator12",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
+
+_JSON_MEDIA_TYPE = "application/json"
+_HEALTH_BYTES = orjson.dumps({"status": "ok"})
+_ROOT_BYTES = orjson.dumps({"message": "Predator12 backend is running"})
+
+
+@app.get("/health")
+async def health() -> Response:
+    """Liveness probe used by deployment health checks."""
+
+    return Response(content=_HEALTH_BYTES, media_type=_JSON_MEDIA_TYPE)
+
+
+@app.get("/")
+async def root() -> Response:
+    """Landing response for the service root."""
+
+    return Response(content=_ROOT_BYTES, media_type=_JSON_MEDIA_TYPE)
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import operator
+from collections import deque
 from dataclasses import dataclass
 from typing import Dict
 
 from .exceptions import RemoteStateError
 from .settings import DEFAULT_SETTINGS, RemoteSettings
 
+_STATE_FIELDS = ("is_on", "current_channel", "volume", "muted")
+_STATE_GETTER = operator.attrgetter(*_STATE_FIELDS)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class RemoteState:
     """A read-only snapshot of the remote controller state."""
 
@@ -21,43 +26,83 @@ class RemoteState:
     def to_dict(self) -> Dict[str, int | bool]:
         """Return the state as a serialisable dictionary."""
 
-        return {
-            "is_on": self.is_on,
-            "current_channel": self.current_channel,
-            "volume": self.volume,
-            "muted": self.muted,
-        }
+        return dict(zip(_STATE_FIELDS, _STATE_GETTER(self)))
 
 
 class RemoteControl:
     """Stateful representation of the "Piter Face" remote control."""
 
+    __slots__ = (
+        "_settings",
+        "_is_on",
+        "_current_channel",
+        "_volume",
+        "_muted",
+        "_previous_volume",
+    )
+
+    _FREE_LIST: deque[RemoteControl] = deque(maxlen=1024)
+
     def __init__(self, settings: RemoteSettings | None = None) -> None:
-        self._settings = settings or DEFAULT_SETTINGS
+        self._reset(settings or DEFAULT_SETTINGS)
+
+    def _reset(self, settings: RemoteSettings) -> None:
+        self._settings = settings
         self._is_on = False
-        self._current_channel = self._settings.default_channel
-        self._volume = self._settings.default_volume
+        self._current_channel = settings.default_channel
+        self._volume = settings.default_volume
         self._muted = False
         self._previous_volume: int | None = None
+        # Dispatch starts in the powered-off state; power transitions swap
+        # the concrete class so action methods need no per-call guard.
+        self.__class__ = _PoweredOff
+
+    # ------------------------------------------------------------------
+    # Object pooling
+    # ------------------------------------------------------------------
+    @classmethod
+    def acquire(cls, settings: RemoteSettings | None = None) -> "RemoteControl":
+        """Return a pooled instance, allocating only when the pool is empty.
+
+        The instance is reset to its powered-off defaults. Callers must
+        hand it back via :meth:`release` and must not retain references to
+        it afterwards.
+        """
+
+        free_list = RemoteControl._FREE_LIST
+        remote = free_list.popleft() if free_list else cls.__new__(cls)
+        remote._reset(settings or DEFAULT_SETTINGS)
+        return remote
+
+    def release(self) -> None:
+        """Return this instance to the pool for reuse by :meth:`acquire`."""
+
+        RemoteControl._FREE_LIST.append(self)
 
     # ------------------------------------------------------------------
     # Power management
     # ------------------------------------------------------------------
     def power_on(self) -> None:
-        """Turn the device on."""
+        """Turn the device on; a no-op if it is already on."""
 
+        if self._is_on:
+            return
         self._is_on = True
         self._muted = False
         self._previous_volume = None
         self._volume = self._settings.default_volume
         self._current_channel = self._settings.default_channel
+        self.__class__ = _PoweredOn
 
     def power_off(self) -> None:
-        """Turn the device off."""
+        """Turn the device off; a no-op if it is already off."""
 
+        if not self._is_on:
+            return
         self._is_on = False
         self._muted = False
         self._previous_volume = None
+        self.__class__ = _PoweredOff
 
     def toggle_power(self) -> None:
         """Toggle the power state of the device."""
@@ -73,7 +118,6 @@ class RemoteControl:
     def set_channel(self, channel: int) -> None:
         """Change the channel to the provided value."""
 
-        self._require_on()
         if not self._settings.min_channel <= channel <= self._settings.max_channel:
             raise RemoteStateError("Channel is outside of the allowed range.")
         self._current_channel = channel
@@ -81,7 +125,6 @@ class RemoteControl:
     def next_channel(self) -> None:
         """Advance to the next channel, wrapping around if needed."""
 
-        self._require_on()
         if self._current_channel >= self._settings.max_channel:
             self._current_channel = self._settings.min_channel
         else:
@@ -90,7 +133,6 @@ class RemoteControl:
     def previous_channel(self) -> None:
         """Go to the previous channel, wrapping around if needed."""
 
-        self._require_on()
         if self._current_channel <= self._settings.min_channel:
             self._current_channel = self._settings.max_channel
         else:
@@ -102,7 +144,6 @@ class RemoteControl:
     def increase_volume(self, step: int = 1) -> None:
         """Increase the volume by ``step`` units."""
 
-        self._require_on()
         if step < 0:
             raise RemoteStateError("Volume step must be non-negative.")
         self._volume = min(self._volume + step, self._settings.max_volume)
@@ -113,7 +154,6 @@ class RemoteControl:
     def decrease_volume(self, step: int = 1) -> None:
         """Decrease the volume by ``step`` units."""
 
-        self._require_on()
         if step < 0:
             raise RemoteStateError("Volume step must be non-negative.")
         self._volume = max(self._volume - step, self._settings.min_volume)
@@ -126,7 +166,6 @@ class RemoteControl:
     def mute(self) -> None:
         """Mute the device, remembering the previous volume."""
 
-        self._require_on()
         if not self._muted:
             self._previous_volume = self._volume
             self._volume = 0
@@ -135,7 +174,6 @@ class RemoteControl:
     def unmute(self) -> None:
         """Restore the volume after muting."""
 
-        self._require_on()
         if self._muted:
             self._volume = (
                 self._previous_volume
@@ -186,4 +224,37 @@ class RemoteControl:
             raise RemoteStateError("The device must be powered on to perform this action.")
 
 
+class _PoweredOff(RemoteControl):
+    """State class used while the device is off: every action raises."""
+
+    __slots__ = ()
+
+    def set_channel(self, channel: int) -> None:
+        self._require_on()
+
+    def next_channel(self) -> None:
+        self._require_on()
+
+    def previous_channel(self) -> None:
+        self._require_on()
+
+    def increase_volume(self, step: int = 1) -> None:
+        self._require_on()
+
+    def decrease_volume(self, step: int = 1) -> None:
+        self._require_on()
+
+    def mute(self) -> None:
+        self._require_on()
+
+    def unmute(self) -> None:
+        self._require_on()
+
+
+class _PoweredOn(RemoteControl):
+    """State class used while the device is on: inherits unguarded actions."""
+
+    __slots__ = ()
+
+
 __all__ = ["RemoteControl", "RemoteState"]
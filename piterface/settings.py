@@ -7,8 +7,20 @@ from typing import Any, Mapping
 
 from .exceptions import RemoteValidationError
 
+_ALLOWED_KEYS = frozenset(
+    (
+        "name",
+        "min_channel",
+        "max_channel",
+        "default_channel",
+        "min_volume",
+        "max_volume",
+        "default_volume",
+    )
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class RemoteSettings:
     """Settings describing the capabilities of the remote controller."""
 
@@ -21,6 +33,17 @@ class RemoteSettings:
     default_volume: int = 10
 
     def __post_init__(self) -> None:
+        # One short-circuit expression covers the common valid case; the
+        # four-way diagnosis runs only when something is actually wrong.
+        if not (
+            self.min_channel < self.max_channel
+            and self.min_channel <= self.default_channel <= self.max_channel
+            and self.min_volume < self.max_volume
+            and self.min_volume <= self.default_volume <= self.max_volume
+        ):
+            self._raise_invalid()
+
+    def _raise_invalid(self) -> None:
         if self.min_channel >= self.max_channel:
             raise RemoteValidationError(
                 "The minimum channel must be smaller than the maximum channel."
@@ -33,32 +56,28 @@ class RemoteSettings:
             raise RemoteValidationError(
                 "The minimum volume must be smaller than the maximum volume."
             )
-        if not self.min_volume <= self.default_volume <= self.max_volume:
-            raise RemoteValidationError(
-                "Default volume must be within the allowed volume range."
-            )
+        raise RemoteValidationError(
+            "Default volume must be within the allowed volume range."
+        )
 
     @classmethod
     def from_mapping(cls, mapping: Mapping[str, Any]) -> "RemoteSettings":
         """Create settings from a mapping (e.g. JSON/YAML configuration)."""
 
-        allowed_keys = {
-            "name",
-            "min_channel",
-            "max_channel",
-            "default_channel",
-            "min_volume",
-            "max_volume",
-            "default_volume",
-        }
+        kwargs: dict[str, Any] = {}
+        unknown_keys: list[str] = []
+        for key, value in mapping.items():
+            if key in _ALLOWED_KEYS:
+                kwargs[key] = value
+            else:
+                unknown_keys.append(key)
 
-        unknown_keys = set(mapping) - allowed_keys
         if unknown_keys:
             raise RemoteValidationError(
                 f"Unknown configuration keys: {', '.join(sorted(unknown_keys))}"
             )
 
-        return cls(**{key: mapping[key] for key in mapping if key in allowed_keys})
+        return cls(**kwargs)
 
 
 DEFAULT_SETTINGS = RemoteSettings()
@@ -0,0 +1 @@
+"""Operational helper scripts for the Piter Face project."""
@@ -0,0 +1,158 @@
+"""Parsing and validation helpers for ``.env`` configuration files."""
+
+from __future__ import annotations
+
+import functools
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Mapping
+
+_ENV_LINE_RE = re.compile(
+    r"^[ \t]*(?P<key>[A-Za-z_]\w*)[ \t]*=[ \t]*(?P<value>[^\n]*?)[ \t\r]*$",
+    re.MULTILINE,
+)
+_TOKEN_RE = re.compile(r"^\d+:[A-Za-z0-9_-]{30,}$")
+# The atomic group keeps domain matching linear: the engine cannot
+# backtrack into consumed dot-separated segments on adversarial input.
+_EMAIL_RE = re.compile(r"^[A-Za-z0-9_.+-]+@(?>[A-Za-z0-9-]+\.)+[A-Za-z]{2,}$")
+
+_QUOTES = ('"', "'")
+
+_DEFAULT_REQUIRED = ("BOT_TOKEN", "OWNER_ID")
+
+_EMPTY: tuple[str, ...] = ()
+
+# (key, predicate, error message) triples checked whenever the key is
+# present and non-empty; one loop keeps the hot path on a single code path.
+_FIELD_VALIDATORS = (
+    ("BOT_TOKEN", _TOKEN_RE.match, "BOT_TOKEN does not look like a valid bot token."),
+    (
+        "TELEGRAM_TOKEN",
+        _TOKEN_RE.match,
+        "TELEGRAM_TOKEN does not look like a valid bot token.",
+    ),
+    ("OWNER_ID", str.isdigit, "OWNER_ID must contain only digits."),
+    ("TELEGRAM_CHAT_ID", str.isdigit, "TELEGRAM_CHAT_ID must contain only digits."),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationResult:
+    """Outcome of validating a set of environment values."""
+
+    errors: tuple[str, ...]
+    warnings: tuple[str, ...]
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+
+_VALID_RESULT = ValidationResult(_EMPTY, _EMPTY)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_schema(
+    required_keys: tuple[str, ...],
+) -> tuple[frozenset[str], tuple]:
+    """Return the reusable (required-set, validator-table) pair for a schema."""
+
+    return frozenset(required_keys), _FIELD_VALIDATORS
+
+
+def parse_env_text(text: str) -> dict[str, str]:
+    """Parse the whole text of a ``.env`` file into a dictionary.
+
+    The multiline regex extracts every ``KEY=VALUE`` pair in one sweep of
+    the C regex engine; blank lines and ``#`` comments never match, and
+    surrounding quotes are stripped from values.
+    """
+
+    result: dict[str, str] = {}
+    result_setitem = result.__setitem__
+    for match in _ENV_LINE_RE.finditer(text):
+        value = match.group("value")
+        if value.startswith(_QUOTES) and len(value) >= 2 and value[-1] == value[0]:
+            value = value[1:-1]
+        result_setitem(match.group("key"), value)
+    return result
+
+
+def parse_env_lines(lines: Iterable[str]) -> dict[str, str]:
+    """Parse ``KEY=VALUE`` lines into a dictionary.
+
+    Thin compatibility wrapper around :func:`parse_env_text` for callers
+    that hold an iterable of lines rather than the whole file text.
+    """
+
+    return parse_env_text("\n".join(lines))
+
+
+def load_env_file(path: Path) -> dict[str, str]:
+    """Load and parse a ``.env`` file located at ``path``.
+
+    The file is read as raw bytes and decoded in one call, skipping the
+    ``TextIOWrapper`` newline-translation machinery.
+    """
+
+    return parse_env_text(path.read_bytes().decode("utf-8"))
+
+
+def validate_env(
+    data: Mapping[str, str],
+    required_keys: Iterable[str] = _DEFAULT_REQUIRED,
+) -> ValidationResult:
+    """Validate environment values and collect errors and warnings.
+
+    Results are memoised per ``(data, required_keys)`` combination, so
+    repeated validation of an unchanged configuration is a cache hit.
+    """
+
+    return _validate_env_cached(frozenset(data.items()), tuple(required_keys))
+
+
+@functools.lru_cache(maxsize=128)
+def _validate_env_cached(
+    frozen_items: frozenset[tuple[str, str]],
+    required_keys: tuple[str, ...],
+) -> ValidationResult:
+    data = dict(frozen_items)
+    errors: list[str] = []
+    warnings: list[str] = []
+    errors_append = errors.append
+    data_get = data.get
+    required_set, field_validators = _compile_schema(required_keys)
+    for key in required_keys:
+        value = data_get(key)
+        if value is None:
+            errors_append(f"Missing required key: {key}")
+        elif not value.strip():
+            errors_append(f"Required key must not be empty: {key}")
+
+    for key, predicate, message in field_validators:
+        value = data_get(key)
+        if value and not predicate(value):
+            errors_append(message)
+
+    for key, value in data.items():
+        if key.endswith("_EMAIL") and value and not _EMAIL_RE.match(value):
+            errors_append(f"{key} is not a valid e-mail address.")
+        if not value and key not in required_set:
+            warnings.append(f"{key} is set but empty.")
+
+    if not errors and not warnings:
+        return _VALID_RESULT
+    return ValidationResult(
+        tuple(errors) if errors else _EMPTY,
+        tuple(warnings) if warnings else _EMPTY,
+    )
+
+
+__all__ = [
+    "ValidationResult",
+    "load_env_file",
+    "parse_env_lines",
+    "parse_env_text",
+    "validate_env",
+]
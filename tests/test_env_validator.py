@@ -0,0 +1,107 @@
+"""Unit tests for the ``.env`` parsing and validation helpers."""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.env_validator import (
+    load_env_file,
+    parse_env_lines,
+    parse_env_text,
+    validate_env,
+)
+
+VALID_TOKEN = "123456:" + "a" * 35
+
+
+class ParseEnvLinesTestCase(unittest.TestCase):
+    def test_basic_pairs(self) -> None:
+        parsed = parse_env_lines(["A=1", "B=two"])
+        self.assertEqual(parsed, {"A": "1", "B": "two"})
+
+    def test_skips_comments_and_blank_lines(self) -> None:
+        parsed = parse_env_lines(["# comment", "", "  ", "KEY=value"])
+        self.assertEqual(parsed, {"KEY": "value"})
+
+    def test_strips_matching_quotes(self) -> None:
+        parsed = parse_env_lines(['A="quoted"', "B='single'", 'C="unmatched'])
+        self.assertEqual(parsed, {"A": "quoted", "B": "single", "C": '"unmatched'})
+
+    def test_later_assignment_wins(self) -> None:
+        parsed = parse_env_lines(["A=1", "A=2"])
+        self.assertEqual(parsed, {"A": "2"})
+
+    def test_parse_env_text_matches_line_parser(self) -> None:
+        text = "# header\nA=1\n\nB='two'\n"
+        self.assertEqual(parse_env_text(text), parse_env_lines(text.splitlines()))
+
+    def test_load_env_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / ".env"
+            path.write_text("# header\nBOT_TOKEN=abc\nOWNER_ID=42\n", encoding="utf-8")
+            self.assertEqual(
+                load_env_file(path), {"BOT_TOKEN": "abc", "OWNER_ID": "42"}
+            )
+
+    def test_load_env_file_with_crlf_newlines(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / ".env"
+            path.write_bytes(b"A=1\r\nB=2\r\n")
+            self.assertEqual(load_env_file(path), {"A": "1", "B": "2"})
+
+
+class ValidateEnvTestCase(unittest.TestCase):
+    def test_valid_configuration(self) -> None:
+        result = validate_env({"BOT_TOKEN": VALID_TOKEN, "OWNER_ID": "42"})
+        self.assertTrue(result.is_valid)
+        self.assertEqual(result.errors, ())
+        self.assertEqual(result.warnings, ())
+
+    def test_missing_required_key(self) -> None:
+        result = validate_env({"BOT_TOKEN": VALID_TOKEN})
+        self.assertFalse(result.is_valid)
+        self.assertIn("Missing required key: OWNER_ID", result.errors)
+
+    def test_empty_required_key(self) -> None:
+        result = validate_env({"BOT_TOKEN": VALID_TOKEN, "OWNER_ID": " "})
+        self.assertIn("Required key must not be empty: OWNER_ID", result.errors)
+
+    def test_malformed_token_and_owner(self) -> None:
+        result = validate_env({"BOT_TOKEN": "not-a-token", "OWNER_ID": "abc"})
+        self.assertIn(
+            "BOT_TOKEN does not look like a valid bot token.", result.errors
+        )
+        self.assertIn("OWNER_ID must contain only digits.", result.errors)
+
+    def test_valid_email(self) -> None:
+        result = validate_env(
+            {
+                "BOT_TOKEN": VALID_TOKEN,
+                "OWNER_ID": "42",
+                "ADMIN_EMAIL": "admin+alerts@example.co.uk",
+            }
+        )
+        self.assertTrue(result.is_valid)
+
+    def test_invalid_email(self) -> None:
+        result = validate_env(
+            {"BOT_TOKEN": VALID_TOKEN, "OWNER_ID": "42", "ADMIN_EMAIL": "nope"}
+        )
+        self.assertIn("ADMIN_EMAIL is not a valid e-mail address.", result.errors)
+
+    def test_empty_optional_key_warns(self) -> None:
+        result = validate_env(
+            {"BOT_TOKEN": VALID_TOKEN, "OWNER_ID": "42", "EXTRA": ""}
+        )
+        self.assertTrue(result.is_valid)
+        self.assertIn("EXTRA is set but empty.", result.warnings)
+
+    def test_custom_required_keys(self) -> None:
+        result = validate_env({"API_KEY": "secret"}, required_keys=("API_KEY",))
+        self.assertTrue(result.is_valid)
+
+
+if __name__ == "__main__":
+    unittest.main()
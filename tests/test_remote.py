@@ -29,6 +29,14 @@ class RemoteControlTestCase(unittest.TestCase):
         self.assertEqual(state.current_channel, self.remote.settings.default_channel)
         self.assertEqual(state.volume, self.remote.settings.default_volume)
 
+    def test_power_on_while_on_keeps_state(self) -> None:
+        self.remote.power_on()
+        self.remote.set_channel(7)
+        self.remote.increase_volume(5)
+        self.remote.power_on()
+        self.assertEqual(self.remote.current_channel, 7)
+        self.assertEqual(self.remote.volume, self.remote.settings.default_volume + 5)
+
     def test_channel_change_requires_power(self) -> None:
         with self.assertRaises(exceptions.RemoteStateError):
             self.remote.set_channel(5)
@@ -84,6 +92,27 @@ class RemoteControlTestCase(unittest.TestCase):
             self.remote.decrease_volume(-1)
 
 
+class RemoteControlPoolTestCase(unittest.TestCase):
+    def test_acquire_returns_powered_off_defaults(self) -> None:
+        remote = RemoteControl.acquire()
+        try:
+            self.assertFalse(remote.is_on)
+            self.assertEqual(remote.current_channel, remote.settings.default_channel)
+        finally:
+            remote.release()
+
+    def test_release_then_acquire_reuses_instance(self) -> None:
+        remote = RemoteControl.acquire()
+        remote.power_on()
+        remote.set_channel(5)
+        remote.release()
+        reused = RemoteControl.acquire()
+        self.assertIs(reused, remote)
+        self.assertFalse(reused.is_on)
+        self.assertEqual(reused.current_channel, reused.settings.default_channel)
+        reused.release()
+
+
 class RemoteSettingsTestCase(unittest.TestCase):
     def test_invalid_channel_range(self) -> None:
         with self.assertRaises(exceptions.RemoteValidationError):